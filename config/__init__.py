@@ -1,4 +1,4 @@
 """Init file for the config package"""
 
 from .config import *
-from .logger import LoggerConfig, logger
+from .logger import BufferedFileHandler, LoggerConfig, logger
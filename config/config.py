@@ -3,18 +3,15 @@
 import os
 from dotenv import load_dotenv
 
+# Load the .env file once, without overriding variables already defined in the environment
+load_dotenv()
+
 
 # Get the environment variables defined in the .env file or in the environment
 def _get_env_var(var_name: str):
-    # Try to get the environment variable
     var = os.getenv(var_name)
 
-    # If it is not defined, try to load the .env file
-    if var is None:
-        load_dotenv(override=True)
-        var = os.getenv(var_name)
-
-    # If the variable is still not defined, raise an exception
+    # If the variable is not defined, raise an exception
     if var is None:
         raise ValueError(f"The required environment variable {var_name} is not defined")
 
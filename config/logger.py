@@ -1,10 +1,52 @@
 """Module providing logging functionality for the project"""
 
 import logging
+import multiprocessing
 import os
 import sys
 
 
+# Loggers already configured in this process, by name
+_loggers: dict[str, logging.Logger] = {}
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    A FileHandler that writes through a large buffer instead of flushing every record.
+
+    The buffer is written to disk when it is full, when flush() or close() are called, or at
+    interpreter exit (logging.shutdown).
+
+    Parameters
+    ----------
+    buffer_size : int
+        The size in bytes of the file buffer. Default is 1 MiB.
+    """
+
+    def __init__(self, filename, mode="a", encoding=None, buffer_size: int = 1 << 20):
+        self.buffer_size = buffer_size
+        super().__init__(filename, mode=mode, encoding=encoding)
+
+    def _open(self):
+        """Open the log file with a buffer of 'buffer_size' bytes"""
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record):
+        """Write the record to the buffered stream without flushing it"""
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
 class LoggerConfig:
     """
     A class that provides logging functionality.
@@ -17,6 +59,9 @@ class LoggerConfig:
         If True, a StreamHandler will be created.
     file_handler : bool
         If True, a FileHandler will be created.
+    buffered : bool
+        If True, the FileHandler writes through a large buffer and is only flushed on demand
+        (see BufferedFileHandler). Recommended for high-volume loggers such as the metrics ones.
 
     Methods
     -------
@@ -29,14 +74,21 @@ class LoggerConfig:
         name: str,
         stream_handler: bool = True,
         file_handler: bool = True,
+        buffered: bool = False,
     ):
+        # Reuse the logger if it was already configured in this process
+        if name in _loggers:
+            self.logger = _loggers[name]
+            return
+
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.DEBUG)
 
         if not self.logger.handlers:
-            self._configure_handlers(stream_handler, file_handler)
+            self._configure_handlers(stream_handler, file_handler, buffered)
+        _loggers[name] = self.logger
 
-    def _configure_handlers(self, stream_handler, file_handler):
+    def _configure_handlers(self, stream_handler, file_handler, buffered):
         """Set handlers for the logger"""
 
         # Formatter
@@ -56,7 +108,12 @@ class LoggerConfig:
             path = os.path.abspath(".")
             log_file_path = os.path.join(path, f"{self.logger.name}.log")
 
-            fh = logging.FileHandler(log_file_path, mode="w", encoding="utf-8")
+            # The main process truncates the log file, but every handler (including the ones of
+            # worker processes) appends to it so that records never overwrite each other
+            if multiprocessing.parent_process() is None:
+                open(log_file_path, "w", encoding="utf-8").close()
+            handler_class = BufferedFileHandler if buffered else logging.FileHandler
+            fh = handler_class(log_file_path, mode="a", encoding="utf-8")
             fh.setLevel(10)
             fh.setFormatter(formatter)
             self.logger.addHandler(fh)
@@ -2,7 +2,7 @@
 
 from .extract import get_data_files, micro_batches_generator
 from .transform import add_processed_date, convert_to_date, add_date_partition
-from .load import load_row
+from .load import load_batch, load_file
 
 __all__ = [
     "get_data_files",
@@ -10,5 +10,6 @@ __all__ = [
     "add_processed_date",
     "convert_to_date",
     "add_date_partition",
-    "load_row",
+    "load_batch",
+    "load_file",
 ]
@@ -1,9 +1,14 @@
 """Module providing extraction functions for the ETL pipeline."""
 
 import os
-import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
 from config import logger
 
+# Column types of the data files. Declaring them skips type inference and guarantees that
+# 'price' is always a float64 column, even in batches without missing values
+DTYPES = {"timestamp": "string", "price": "float64", "user_id": "int64"}
+
 
 def get_data_files(exclude_validation: bool = False, only_validation: bool = False):
     """Generates a list of files from the data folder to be processed."""
@@ -27,12 +32,35 @@ def get_data_files(exclude_validation: bool = False, only_validation: bool = Fal
         raise
 
 
-def micro_batches_generator(file_path: str, chunk_size: int):
-    """Generate micro batches from a CSV file."""
+def micro_batches_generator(
+    file_path: str, chunk_size: int, dtype: dict[str, str | pa.DataType] | None = None
+):
+    """Generate micro batches from a CSV file.
+
+    The file is streamed with PyArrow's CSV reader and the record batches are re-sliced into
+    pandas DataFrames of 'chunk_size' rows. The column types are taken from 'dtype' (DTYPES
+    by default) instead of being inferred.
+    """
     try:
-        df = pd.read_csv(file_path, chunksize=chunk_size)
-        for chunk in df:
-            yield chunk
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError("'chunksize' must be an integer >=1")
+
+        convert_options = pa_csv.ConvertOptions(column_types=DTYPES if dtype is None else dtype)
+        reader = pa_csv.open_csv(file_path, convert_options=convert_options)
+        pending = None
+        for batch in reader:
+            table = pa.Table.from_batches([batch])
+            if pending is not None:
+                table = pa.concat_tables([pending, table])
+
+            # Yield full micro batches and keep the remaining rows for the next record batch
+            while table.num_rows >= chunk_size:
+                yield table.slice(0, chunk_size).to_pandas()
+                table = table.slice(chunk_size)
+            pending = table
+
+        if pending is not None and pending.num_rows > 0:
+            yield pending.to_pandas()
     except Exception as e:
         logger.fatal(f"Error while generating micro batch for {file_path}: {e}")
         raise
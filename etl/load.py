@@ -1,28 +1,87 @@
 """Module providing load functions for the ETL pipeline."""
 
+import os
+import tempfile
 import pandas as pd
 from config import logger
 from utils import MySQLDatabase
 
+# Columns loaded into the target table, in insertion order
+COLUMNS = ["timestamp", "day", "month", "year", "price", "user_id", "processed_date"]
 
-def load_row(db: MySQLDatabase, table_name: str, row: pd.Series):
-    """Load data into a MySQL database."""
+# Maximum number of rows sent per INSERT statement, to stay below 'max_allowed_packet'
+MAX_ROWS_PER_INSERT = 10_000
+
+
+def _insert_sql(table_name: str):
+    """Build the INSERT statement for the target table.
+
+    The statement must keep the plain ``INSERT INTO t (...) VALUES (%s, ...)`` form (no trailing
+    semicolon) so that PyMySQL's ``executemany`` rewrites it into a single multi-row INSERT.
+    """
+    columns = ", ".join(COLUMNS)
+    placeholders = ", ".join(["%s"] * len(COLUMNS))
+    return f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
+
+
+def load_batch(
+    db: MySQLDatabase,
+    table_name: str,
+    rows_df: pd.DataFrame,
+    batch_size: int = MAX_ROWS_PER_INSERT,
+    commit: bool = True,
+):
+    """Load a whole microbatch into a MySQL database using multi-row INSERT statements.
+
+    If 'commit' is False, the caller is responsible for committing the transaction.
+    """
     try:
-        values_to_insert = (
-            row.timestamp if pd.notna(row.timestamp) else None,
-            row.day if pd.notna(row.day) else None,
-            row.month if pd.notna(row.month) else None,
-            row.year if pd.notna(row.year) else None,
-            row.price if pd.notna(row.price) else None,
-            row.user_id if pd.notna(row.user_id) else None,
-            row.processed_date if pd.notna(row.processed_date) else None,
-        )
+        # Replace NaN/NaT with None once for the whole chunk
+        rows_df = rows_df[COLUMNS].astype(object)
+        rows_df = rows_df.where(rows_df.notna(), None)
+        values_to_insert = list(rows_df.itertuples(index=False, name=None))
+
+        # Send at most 'batch_size' rows per statement
+        sql = _insert_sql(table_name)
+        for start in range(0, len(values_to_insert), batch_size):
+            db.insert(sql, values_to_insert[start : start + batch_size], commit=False)
+
+        if commit:
+            db.commit()
+    except Exception as e:
+        logger.fatal(f"Error while loading microbatch into MySQL: {e}")
+        raise
+
+
+def load_file(db: MySQLDatabase, table_name: str, chunk: pd.DataFrame, commit: bool = True):
+    """Load a whole microbatch into a MySQL database with LOAD DATA LOCAL INFILE.
+
+    The chunk is written to a temporary CSV file (NULL values as ``\\N``) which is then
+    streamed to the server in a single statement. If 'commit' is False, the caller is
+    responsible for committing the transaction.
+    """
+    tmp = tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False, encoding="utf-8")
+    try:
+        with tmp:
+            chunk[COLUMNS].to_csv(
+                tmp,
+                index=False,
+                header=False,
+                na_rep="\\N",
+                lineterminator="\n",
+                date_format="%Y-%m-%d %H:%M:%S.%f",
+            )
 
-        db.insert(
-            f"INSERT INTO {table_name}"
-            + "(timestamp, day, month, year, price, user_id, processed_date) VALUES (%s, %s, %s, %s, %s, %s, %s)",
-            values_to_insert,
+        db.load_data(
+            "LOAD DATA LOCAL INFILE %s"
+            + f" INTO TABLE {table_name}"
+            + " FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' LINES TERMINATED BY '\\n'"
+            + f" ({', '.join(COLUMNS)})",
+            (tmp.name,),
+            commit=commit,
         )
     except Exception as e:
-        logger.fatal(f"Error while loading row '{row}' into MySQL: {e}")
+        logger.fatal(f"Error while loading microbatch file into MySQL: {e}")
         raise
+    finally:
+        os.remove(tmp.name)
@@ -4,10 +4,10 @@ import pandas as pd
 from config import logger
 
 
-def add_processed_date(chunk):
-    """Add a processed date to the chunk."""
+def add_processed_date(chunk, processed_date: pd.Timestamp | None = None):
+    """Add a processed date to the chunk. If not given, the current time is used."""
     try:
-        chunk["processed_date"] = pd.to_datetime("now")
+        chunk["processed_date"] = pd.Timestamp.now() if processed_date is None else processed_date
         return chunk
     except Exception as e:
         logger.error(f"Error while adding processed date: {e}")
@@ -24,13 +24,13 @@ def convert_to_date(chunk):
         raise
 
 
-def add_date_partition(row):
-    """Add year, month and day columns to the row."""
+def add_date_partition(chunk):
+    """Add year, month and day columns to the chunk."""
     try:
-        row["day"] = row["timestamp"].day
-        row["month"] = row["timestamp"].month
-        row["year"] = row["timestamp"].year
-        return row
+        chunk["day"] = chunk["timestamp"].dt.day
+        chunk["month"] = chunk["timestamp"].dt.month
+        chunk["year"] = chunk["timestamp"].dt.year
+        return chunk
     except Exception as e:
         logger.error(f"Error while adding date partition: {e}")
         raise
@@ -1,6 +1,9 @@
 """ETL pipeline to process the data files."""
 
-from logging import Logger
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from logging import INFO, Logger
+import os
+import numpy as np
 import pandas as pd
 from config import logger
 from etl import (
@@ -8,9 +11,166 @@ from etl import (
     add_processed_date,
     convert_to_date,
     add_date_partition,
-    load_row,
+    load_batch,
+    load_file,
 )
-from utils import MySQLDatabase
+from utils import MySQLDatabase, prefetch
+
+# Maximum number of raw microbatches read ahead of the transformations
+PREFETCHED_BATCHES = 2
+
+# Maximum number of transformed microbatches waiting to be loaded into the database
+MAX_PENDING_BATCHES = 4
+
+# Metrics logged after each microbatch ('%' placeholders are only formatted if the record is emitted)
+METRICS_TEMPLATE = """
+    -----------------------------------------
+    ---------- ACTUAL FILE METRICS ----------
+    -----------------------------------------
+    Actual file: '%s',
+    Microbatch: %s,
+    Microbatch rows: %s,
+    Total rows processed: %s,
+
+    -----------------------------------------
+    -------- ACTUAL PIPELINE METRICS --------
+    -----------------------------------------
+    Total rows processed: %s,
+    Sum price: %s,
+    Average price: %s
+    Min price: %s
+    Max price: %s
+    """
+
+
+# Price statistics as (sum, count, min, max), before any price has been seen
+EMPTY_STATS = (0.0, 0, None, None)
+
+
+def update_stats(prices: np.ndarray):
+    """Compute the (sum, count, min, max) price statistics of an array of prices.
+
+    Missing (NaN) prices are ignored. The whole array is reduced with NumPy in a single call.
+    """
+    prices = prices[~np.isnan(prices)]
+    if prices.size == 0:
+        return EMPTY_STATS
+
+    return (float(prices.sum()), int(prices.size), float(prices.min()), float(prices.max()))
+
+
+def merge_stats(
+    running: tuple[float, int, float | None, float | None],
+    batch: tuple[float, int, float | None, float | None],
+):
+    """Merge the (sum, count, min, max) statistics of a batch into the running ones."""
+    if batch[1] == 0:
+        return running
+
+    sum_price, count_price, min_price, max_price = running
+    sum_batch, count_batch, min_batch, max_batch = batch
+    return (
+        sum_price + sum_batch,
+        count_price + count_batch,
+        min_batch if min_price is None else min(min_price, min_batch),
+        max_batch if max_price is None else max(max_price, max_batch),
+    )
+
+
+def _transform_batches(micro_batches, processed_date: pd.Timestamp):
+    """Add the necessary columns to each microbatch."""
+    for chunk in micro_batches:
+        chunk = add_processed_date(chunk, processed_date=processed_date)
+        chunk = convert_to_date(chunk)
+        chunk = add_date_partition(chunk)
+        yield chunk
+
+
+def transformed_batches_generator(file_path: str, chunk_size: int, processed_date: pd.Timestamp):
+    """Generate transformed micro batches from a CSV file.
+
+    The file is read and transformed in two background threads, so the next microbatches are
+    parsed and transformed while the caller loads the current one into the database.
+    """
+    micro_batches = prefetch(
+        micro_batches_generator(file_path=file_path, chunk_size=chunk_size),
+        n=PREFETCHED_BATCHES,
+    )
+    return prefetch(_transform_batches(micro_batches, processed_date), n=MAX_PENDING_BATCHES)
+
+
+def process_file(
+    file_path: str,
+    db: MySQLDatabase,
+    table_name: str,
+    chunk_size: int,
+    processed_date: pd.Timestamp,
+    bulk_load: bool = True,
+):
+    """Load a data file into the database through an open 'db' connection.
+
+    Returns the statistics of each microbatch as a list of
+    (rows, sum_price, count_price, min_price, max_price) tuples.
+    """
+    logger.info(f"Processing file '{file_path}'...")
+    micro_batches = transformed_batches_generator(
+        file_path=file_path, chunk_size=chunk_size, processed_date=processed_date
+    )
+    batches_stats = []
+
+    # Load the whole file in a single transaction, rolling it back on failure
+    db.begin()
+    try:
+        # Process each transformed microbatch
+        for n, chunk in enumerate(micro_batches):
+            logger.debug(f"Processing microbatch {n+1}...")
+
+            # Load the whole microbatch into the database
+            if bulk_load:
+                load_file(db=db, table_name=table_name, chunk=chunk, commit=False)
+            else:
+                load_batch(db=db, table_name=table_name, rows_df=chunk, commit=False)
+
+            # Collect the price statistics of the microbatch
+            batch_stats = update_stats(chunk["price"].to_numpy(dtype="float64"))
+            batches_stats.append((len(chunk), *batch_stats))
+            logger.debug(f"Microbatch {n+1} processed successfully")
+        db.commit()
+    except Exception:
+        micro_batches.close()
+        db.rollback()
+        raise
+
+    logger.info(f"File '{file_path}' processed successfully")
+    return batches_stats
+
+
+def process_files(
+    file_paths: list[str],
+    connection_params: tuple[str, str, str, str],
+    table_name: str,
+    chunk_size: int,
+    processed_date: pd.Timestamp,
+    bulk_load: bool = True,
+):
+    """Load several data files into the database, reusing a single connection.
+
+    It is meant to run in a worker process, so it opens its own connection from the
+    (host, user, password, db) 'connection_params' and keeps it open across the files.
+    Returns a list of (file_path, batches_stats, error) tuples, in the order of 'file_paths'.
+    Each file is loaded in its own transaction, so a failing file (whose 'batches_stats' is
+    None) doesn't prevent the remaining ones from being loaded.
+    """
+    results = []
+    db = MySQLDatabase(*connection_params)
+    with db:
+        for f in file_paths:
+            try:
+                batches_stats = process_file(f, db, table_name, chunk_size, processed_date, bulk_load)
+                results.append((f, batches_stats, None))
+            except Exception as e:
+                results.append((f, None, e))
+    return results
 
 
 def run_data_pipeline(
@@ -19,63 +179,104 @@ def run_data_pipeline(
     table_name: str,
     chunk_size: int,
     metrics_logger: Logger,
+    bulk_load: bool = True,
+    max_workers: int | None = None,
 ):
-    """Pipeline to process the data files."""
+    """Pipeline to process the data files.
+
+    'db' only supplies the connection parameters: it does not need to be open, and its own
+    connection (if any) is not used, so there is no need to call this inside 'with db:'.
+
+    Files are processed in parallel by a pool of 'max_workers' processes (by default, one
+    per CPU, never more than the number of files). Each worker opens its own connection with
+    the parameters of 'db' and keeps it open for all the files assigned to it. The metrics are
+    aggregated and logged by the calling process as each worker finishes. If some files fail,
+    the metrics of the files that were loaded are still logged and the first error is raised
+    at the end.
+
+    If 'bulk_load' is True, each microbatch is loaded with LOAD DATA LOCAL INFILE,
+    otherwise it is loaded with batched INSERT statements.
+    """
+
+    files = list(files)
+    if not files:
+        return
 
     total_rows = 0
-    prices = []
 
-    # Process each file individually to avoid memory overload
-    for f in files:
-        logger.info(f"Processing file '{f}'...")
-        micro_batches = micro_batches_generator(file_path=f, chunk_size=chunk_size)
-        total_rows_file = 0
+    # Every row loaded by this run shares the same processed date
+    processed_date = pd.Timestamp.now()
 
-        # Process each microbatch and add necessary columns
-        for n, chunk in enumerate(micro_batches):
-            logger.debug(f"Processing microbatch {n+1}...")
-            chunk = add_processed_date(chunk)
-            chunk = convert_to_date(chunk)
-            chunk = chunk.apply(add_date_partition, axis=1)
-
-            # Process each row in the microbatch and collect price data for statistics calculation
-            for row in chunk.itertuples(index=False):
-                total_rows += 1
-                total_rows_file += 1
-                actual_row_price = None if pd.isna(row.price) else row.price
-                prices.append(actual_row_price)
-                valid_values = [x for x in prices if x is not None]
-
-                # Calculate statistics (sum, average, min, max) for price
-                sum_price = sum(valid_values)
-                avg_price = sum(valid_values) / len(valid_values)
-                min_price = min(valid_values)
-                max_price = max(valid_values)
-
-                # Load the current row into the database
-                load_row(db=db, table_name=table_name, row=row)
-
-                # Log metrics
-                metrics_logger.info(
-                    f"""
-                    -----------------------------------------
-                    ---------- ACTUAL FILE METRICS ----------
-                    -----------------------------------------
-                    Actual file: '{f}',
-                    Microbatch: {n+1},
-                    Total rows processed: {total_rows_file},
-                    Actual row price: {actual_row_price},
-
-                    -----------------------------------------
-                    -------- ACTUAL PIPELINE METRICS --------
-                    -----------------------------------------
-                    Total rows processed: {total_rows},
-                    Sum price: {sum_price},
-                    Average price: {avg_price}
-                    Min price: {min_price}
-                    Max price: {max_price}
-                    """
+    # Running (sum, count, min, max) statistics for price (missing prices are ignored)
+    stats = EMPTY_STATS
+
+    # Errors raised while loading the files, re-raised once every worker has finished
+    errors = []
+
+    # Split the files between the worker processes, each one with its own connection
+    # (pymysql connections can't be shared between processes)
+    connection_params = (db.host, db.user, db.password, db.db)
+    workers = min(max_workers or os.cpu_count() or 1, len(files))
+    files_per_worker = [files[i::workers] for i in range(workers)]
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    process_files,
+                    worker_files,
+                    connection_params,
+                    table_name,
+                    chunk_size,
+                    processed_date,
+                    bulk_load,
                 )
-            logger.debug(f"Microbatch {n+1} processed successfully")
+                for worker_files in files_per_worker
+            ]
+
+            for future in as_completed(futures):
+                try:
+                    results = future.result()
+                except Exception as e:
+                    # The worker failed as a whole (e.g. it could not connect to the database)
+                    logger.error(f"Error in a worker process of the pipeline: {e}")
+                    errors.append(e)
+                    continue
+
+                for f, file_stats, error in results:
+                    if error is not None:
+                        logger.error(f"File '{f}' could not be loaded: {error}")
+                        errors.append(error)
+                        continue
+
+                    total_rows_file = 0
+
+                    # Update the pipeline statistics with the statistics of each microbatch
+                    for n, (rows, *batch_stats) in enumerate(file_stats):
+                        total_rows += rows
+                        total_rows_file += rows
+                        stats = merge_stats(stats, batch_stats)
+                        sum_price, count_price, min_price, max_price = stats
+                        avg_price = sum_price / count_price if count_price else None
+
+                        # Log metrics once the whole microbatch has been loaded
+                        if metrics_logger.isEnabledFor(INFO):
+                            metrics_logger.info(
+                                METRICS_TEMPLATE,
+                                f,
+                                n + 1,
+                                rows,
+                                total_rows_file,
+                                total_rows,
+                                sum_price,
+                                avg_price,
+                                min_price,
+                                max_price,
+                            )
 
-        logger.info(f"File '{f}' processed successfully")
+        # Raise the first failure once the metrics of every loaded file have been logged
+        if errors:
+            raise errors[0]
+    finally:
+        # Write any buffered metrics to disk, even if a file failed
+        for handler in metrics_logger.handlers:
+            handler.flush()
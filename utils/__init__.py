@@ -1,7 +1,9 @@
 """Init file for the utils package"""
 
 from .database import MySQLDatabase
+from .prefetch import prefetch
 
 __all__ = [
     "MySQLDatabase",
+    "prefetch",
 ]
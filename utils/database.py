@@ -21,7 +21,12 @@ class MySQLDatabase:
         """Establish a connection to the database"""
         try:
             self.connection = pymysql.connect(
-                host=self.host, user=self.user, password=self.password, db=self.db
+                host=self.host,
+                user=self.user,
+                password=self.password,
+                db=self.db,
+                local_infile=True,
+                autocommit=False,
             )
             logger.info(f"Connected successfully to the RDS '{self.host}'")
             return self.connection
@@ -35,12 +40,46 @@ class MySQLDatabase:
             self.connection.close()
             logger.info(f"Connection to the database '{self.host}' has been closed")
 
+    def begin(self):
+        """Begin a new transaction"""
+        try:
+            if self.connection is None:
+                raise MySQLError("Connection to the database has not been established")
+            self.connection.begin()
+            logger.debug("Transaction started successfully")
+        except Exception as e:
+            logger.fatal(f"Error beginning the transaction: {e}")
+            raise
+
+    def commit(self):
+        """Commit the current transaction"""
+        try:
+            if self.connection is None:
+                raise MySQLError("Connection to the database has not been established")
+            self.connection.commit()
+            logger.debug("Transaction committed successfully")
+        except Exception as e:
+            logger.fatal(f"Error committing the transaction: {e}")
+            raise
+
+    def rollback(self):
+        """Roll back the current transaction"""
+        try:
+            if self.connection is None:
+                raise MySQLError("Connection to the database has not been established")
+            self.connection.rollback()
+            logger.warning("Transaction has been rolled back")
+        except Exception as e:
+            logger.fatal(f"Error rolling back the transaction: {e}")
+            raise
+
     def __execute_sql__(
         self,
         sql: str,
         sql_args: list[tuple[Any, ...]] | tuple[Any, ...] | None = None,
         fetch: int = 0,
         commit: bool = True,
+        raise_on_warnings: bool = False,
     ):
         """Execute a SQL statement
 
@@ -54,6 +93,8 @@ class MySQLDatabase:
             The number of rows to fetch. If -1, fetch all rows. If 0 or less, do not fetch any rows.
         commit : bool
             Whether to commit the transaction or not
+        raise_on_warnings : bool
+            Whether to raise an exception (before committing) if the statement produces warnings
 
         Returns
         -------
@@ -66,7 +107,8 @@ class MySQLDatabase:
                 raise MySQLError("Connection to the database has not been established")
 
             sql_statement = " ".join(line.strip() for line in sql.splitlines() if line.strip())
-            if sql_args:
+            # Only single-row arguments can be interpolated for logging purposes
+            if isinstance(sql_args, tuple):
                 sql_statement = sql_statement % sql_args
             logger.debug(f"Executing SQL statement '{sql_statement[0:200]}'...")
             cnx = self.connection
@@ -80,6 +122,15 @@ class MySQLDatabase:
                 else:
                     cursor.execute(sql)
 
+                # Raise if the statement produced warnings (e.g. values coerced to NULL or 0)
+                warning_count = cursor.warning_count
+                if raise_on_warnings and warning_count:
+                    cursor.execute("SHOW WARNINGS LIMIT 5")
+                    warnings = "; ".join(str(w[2]) for w in cursor.fetchall())
+                    raise MySQLError(
+                        f"The SQL statement produced {warning_count} warning(s): {warnings}"
+                    )
+
                 # Fetch the results based on the fetch parameter (only for SELECT statements)
                 if fetch == -1:
                     result = cursor.fetchall()
@@ -128,7 +179,10 @@ class MySQLDatabase:
         return self.__execute_sql__(sql, sql_args, fetch=num_rows, commit=False)
 
     def insert(
-        self, sql: str, sql_args: list[tuple[Any, ...]] | tuple[Any, ...] | None = None
+        self,
+        sql: str,
+        sql_args: list[tuple[Any, ...]] | tuple[Any, ...] | None = None,
+        commit: bool = True,
     ):
         """
         Execute an INSERT statement. Insert rows into the database
@@ -139,6 +193,8 @@ class MySQLDatabase:
             The INSERT statement to execute
         sql_args : list[tuple[Any, ...]] | tuple[Any, ...] | None
             The arguments to pass to the SQL statement
+        commit : bool
+            Whether to commit the transaction or not. If False, call commit() once the batch is done
 
         Examples
         --------
@@ -147,8 +203,43 @@ class MySQLDatabase:
                 db.insert("INSERT INTO TABLE_NAME (COLUMN_NAME1, COLUMN_NAME2) VALUES ('value1', 'value2')")
                 db.insert("INSERT INTO TABLE_NAME (COLUMN_NAME1, COLUMN_NAME2) VALUES (%s, %s)", ("value1", "value2"))
                 db.insert("INSERT INTO TABLE_NAME (COLUMN_NAME1, COLUMN_NAME2) VALUES (%s, %s)", [("value1", "value2"), ("value3", "value4")])
+                db.insert("INSERT INTO TABLE_NAME (COLUMN_NAME1, COLUMN_NAME2) VALUES (%s, %s)", ("value1", "value2"), commit=False)
+                db.commit()
         """
-        return self.__execute_sql__(sql, sql_args)
+        return self.__execute_sql__(sql, sql_args, commit=commit)
+
+    def load_data(
+        self, sql: str, sql_args: tuple[Any, ...] | None = None, commit: bool = True
+    ):
+        """
+        Execute a LOAD DATA statement. Bulk load rows from a file into the database
+
+        Parameters
+        ----------
+        sql : str
+            The LOAD DATA statement to execute
+        sql_args : tuple[Any, ...] | None
+            The arguments to pass to the SQL statement
+        commit : bool
+            Whether to commit the transaction or not. If False, call commit() once the batch is done
+
+        Notes
+        -----
+        LOAD DATA LOCAL INFILE requires the 'local_infile' option to be enabled on the server
+        (it is OFF by default since MySQL 8.0).
+
+        With LOCAL, MySQL handles invalid values as warnings (as if IGNORE were given) instead of
+        errors. Any warning raises a MySQLError before committing, so the caller should roll the
+        transaction back.
+
+        Examples
+        --------
+        >>> db = MySQLDatabase("host", "user", "password", "database")
+            with db:
+                db.load_data("LOAD DATA LOCAL INFILE 'file.csv' INTO TABLE TABLE_NAME FIELDS TERMINATED BY ','")
+                db.load_data("LOAD DATA LOCAL INFILE %s INTO TABLE TABLE_NAME FIELDS TERMINATED BY ','", ("file.csv",))
+        """
+        return self.__execute_sql__(sql, sql_args, commit=commit, raise_on_warnings=True)
 
     def update(
         self, sql: str, sql_args: list[tuple[Any, ...]] | tuple[Any, ...] | None = None
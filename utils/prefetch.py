@@ -0,0 +1,64 @@
+"""Module providing a helper to prefetch the items of a generator in a background thread"""
+
+from collections.abc import Generator, Iterator
+from queue import Empty, Queue
+from threading import Event, Thread
+from typing import Any
+
+# Marks the end of the items put in the queue by the background thread
+_SENTINEL = object()
+
+
+def prefetch(generator: Generator[Any, None, None], n: int = 2) -> Iterator[Any]:
+    """
+    Consume a generator in a background thread, keeping up to 'n' items ready in advance
+
+    Parameters
+    ----------
+    generator : Generator[Any, None, None]
+        The generator to consume
+    n : int
+        The maximum number of items buffered ahead of the caller. Default is 2
+
+    Notes
+    -----
+    Any exception raised by the generator is re-raised to the caller. Closing the returned
+    generator (or leaving it early because of an exception) stops the background thread.
+
+    Examples
+    --------
+    >>> for chunk in prefetch(micro_batches_generator("file.csv", chunk_size=1000)):
+            load_batch(db, "TABLE_NAME", chunk)
+    """
+    items = Queue(maxsize=n)
+    stop = Event()
+    errors = []
+
+    def produce():
+        try:
+            for item in generator:
+                if stop.is_set():
+                    break
+                items.put(item)
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            generator.close()
+            items.put(_SENTINEL)
+
+    thread = Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while (item := items.get()) is not _SENTINEL:
+            yield item
+
+        if errors:
+            raise errors[0]
+    finally:
+        # Stop the thread and drain the queue so that it never blocks on a full queue
+        stop.set()
+        while thread.is_alive():
+            try:
+                items.get(timeout=0.1)
+            except Empty:
+                pass